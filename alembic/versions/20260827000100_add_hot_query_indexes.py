@@ -0,0 +1,29 @@
+"""add indexes for hot query predicates
+
+Revision ID: 20260827000100
+Revises: 20260212000100
+Create Date: 2026-08-27 00:01:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20260827000100"
+down_revision = "20260212000100"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_games_start_time_utc_league",
+        "games",
+        ["start_time_utc", "league"],
+    )
+    op.create_index("ix_picks_game_id", "picks", ["game_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_picks_game_id", table_name="picks")
+    op.drop_index("ix_games_start_time_utc_league", table_name="games")
@@ -0,0 +1,23 @@
+"""add picks created_at index for dashboard ordering
+
+Revision ID: 20260827000200
+Revises: 20260827000100
+Create Date: 2026-08-27 00:02:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20260827000200"
+down_revision = "20260827000100"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_picks_created_at_utc", "picks", ["created_at_utc"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_picks_created_at_utc", table_name="picks")
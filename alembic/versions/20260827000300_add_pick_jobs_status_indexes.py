@@ -0,0 +1,27 @@
+"""add pick_jobs status/locked_at index for stale recovery
+
+Revision ID: 20260827000300
+Revises: 20260827000200
+Create Date: 2026-08-27 00:03:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20260827000300"
+down_revision = "20260827000200"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The claim path is already covered by ix_pick_jobs_status_run_at from
+    # 20250912000500_add_auto_picks; only stale recovery needs a new index.
+    op.create_index(
+        "ix_pick_jobs_status_locked_at_utc", "pick_jobs", ["status", "locked_at_utc"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pick_jobs_status_locked_at_utc", table_name="pick_jobs")
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import json
+import random
 import time
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 MAX_ERROR_SNIPPET = 2000
 OPENAI_CONNECT_TIMEOUT_SECONDS = 15
 OPENAI_READ_TIMEOUT_SECONDS = 150
 OPENAI_MAX_ATTEMPTS = 3
+OPENAI_RETRY_BASE_SECONDS = 0.25
+OPENAI_RETRY_SLEEP_CAP_SECONDS = 8.0
+OPENAI_RETRY_DEADLINE_SECONDS = 120.0
 OPENAI_MAX_OUTPUT_TOKENS = 900
 OPENAI_MAX_OUTPUT_TOKENS_RETRY = 1800
+OPENAI_OUTPUT_TOKEN_BUDGETS = (OPENAI_MAX_OUTPUT_TOKENS, OPENAI_MAX_OUTPUT_TOKENS_RETRY)
 
 _EFFORT_FALLBACKS: dict[str, tuple[str, ...]] = {
     "high": ("high", "medium", "low"),
@@ -23,6 +29,15 @@ from app.ai.prompt import DEV_PROMPT
 from app.ai.schema import PICK_SCHEMA
 from app.settings import decrypt_api_key
 
+# One pooled session for the whole process so retries and successive picks
+# reuse the TCP/TLS connection to api.openai.com instead of re-handshaking.
+# Retries stay in request_pick; the adapter must not add its own.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0),
+)
+
 
 class OpenAIClientError(RuntimeError):
     pass
@@ -75,15 +90,29 @@ def _response_debug_summary(response_json: dict[str, Any]) -> str:
     return "; ".join(parts)
 
 
+# Static request-body fragments, built once and shared by reference across
+# calls. request_pick only reassigns top-level keys on the body, so these
+# nested structures must never be mutated.
+_DEVELOPER_MESSAGE: dict[str, Any] = {
+    "role": "developer",
+    "content": [{"type": "input_text", "text": DEV_PROMPT}],
+}
+_TOOLS: list[dict[str, Any]] = [{"type": "web_search_preview"}]
+_TEXT_FORMAT: dict[str, Any] = {
+    "format": {
+        "type": "json_schema",
+        "name": PICK_SCHEMA["name"],
+        "schema": PICK_SCHEMA["schema"],
+    }
+}
+
+
 def _build_response_payload(model: str, reasoning_effort: str, payload: dict[str, Any]) -> dict[str, Any]:
     return {
         "model": model,
         "reasoning": {"effort": reasoning_effort},
         "input": [
-            {
-                "role": "developer",
-                "content": [{"type": "input_text", "text": DEV_PROMPT}],
-            },
+            _DEVELOPER_MESSAGE,
             {
                 "role": "user",
                 "content": [
@@ -94,15 +123,9 @@ def _build_response_payload(model: str, reasoning_effort: str, payload: dict[str
                 ],
             },
         ],
-        "tools": [{"type": "web_search_preview"}],
+        "tools": _TOOLS,
         "max_output_tokens": OPENAI_OUTPUT_TOKEN_BUDGETS[0],
-        "text": {
-            "format": {
-                "type": "json_schema",
-                "name": PICK_SCHEMA["name"],
-                "schema": PICK_SCHEMA["schema"],
-            }
-        },
+        "text": _TEXT_FORMAT,
     }
 
 
@@ -140,15 +163,17 @@ def request_pick(payload: dict[str, Any], settings) -> tuple[dict[str, Any], str
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
+    retry_deadline = time.monotonic() + OPENAI_RETRY_DEADLINE_SECONDS
     last_exception: requests.RequestException | None = None
     last_missing_output_response: dict[str, Any] | None = None
     for effort in _effort_sequence(settings.openai_reasoning_effort):
-        for max_output_tokens in (OPENAI_MAX_OUTPUT_TOKENS, OPENAI_MAX_OUTPUT_TOKENS_RETRY):
+        for max_output_tokens in OPENAI_OUTPUT_TOKEN_BUDGETS:
             body = _build_response_payload(settings.openai_model, effort, payload)
             body["max_output_tokens"] = max_output_tokens
+            response = None
             for attempt in range(1, OPENAI_MAX_ATTEMPTS + 1):
                 try:
-                    response = requests.post(
+                    response = _SESSION.post(
                         "https://api.openai.com/v1/responses",
                         headers=headers,
                         json=body,
@@ -159,7 +184,19 @@ def request_pick(payload: dict[str, Any], settings) -> tuple[dict[str, Any], str
                     last_exception = exc
                     if attempt == OPENAI_MAX_ATTEMPTS:
                         break
-                    time.sleep(attempt)
+                    if time.monotonic() >= retry_deadline:
+                        raise OpenAIClientError(
+                            "OpenAI request aborted: retry deadline of "
+                            f"{OPENAI_RETRY_DEADLINE_SECONDS:.0f}s exceeded. "
+                            f"Last error: {exc}"
+                        ) from exc
+                    # Jittered exponential backoff so concurrent workers do
+                    # not retry in lockstep during an API incident.
+                    delay = min(
+                        OPENAI_RETRY_SLEEP_CAP_SECONDS,
+                        OPENAI_RETRY_BASE_SECONDS * 2**attempt,
+                    )
+                    time.sleep(delay * (0.5 + random.random()))
                 except requests.RequestException as exc:
                     raise OpenAIClientError(f"OpenAI request failed: {exc}") from exc
 
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 from pathlib import Path
 
@@ -12,7 +12,29 @@ engine = create_engine(
     connect_args={"check_same_thread": False},  # requerido para SQLite en FastAPI
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@event.listens_for(engine, "connect")
+def _tune_sqlite_connection(dbapi_connection, _connection_record) -> None:
+    """Per-connection SQLite tuning for the app + worker sharing one file.
+
+    WAL lets readers proceed during worker writes, NORMAL sync drops the
+    per-commit fsync to WAL-safe levels, and the busy timeout turns
+    'database is locked' errors into short waits.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+# expire_on_commit=False: handlers read attributes (pick.id, settings fields)
+# after commit; without this each access re-SELECTs the row.
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine,
+)
 Base = declarative_base()
 
 def get_db():
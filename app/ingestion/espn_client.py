@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import re
 import time
 from datetime import date
 from typing import Optional
-from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from app.ingestion.leagues import get_league_path
 
@@ -23,6 +23,21 @@ DEFAULT_RETRIES = 3
 DEFAULT_BACKOFF_SECONDS = 0.5
 DEFAULT_USER_AGENT = "bet-tracker/1.0 (+https://example.local)"
 
+# Shared pooled session so per-league polls on every tick reuse the same
+# TCP/TLS connection to ESPN instead of re-handshaking. Retries stay in
+# fetch_scoreboard; the adapter must not add its own.
+_SESSION = requests.Session()
+_SESSION.headers.update(
+    {
+        "User-Agent": DEFAULT_USER_AGENT,
+        "Accept": "application/json",
+    }
+)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0),
+)
+
 
 def normalize_dates(value: str | date | None) -> str | None:
     if value is None:
@@ -103,50 +118,34 @@ def fetch_scoreboard(league_key: str, game_date: Optional[date | str] = None) ->
             "date": safe_date,
         }
 
-    headers = {
-        "User-Agent": DEFAULT_USER_AGENT,
-        "Accept": "application/json",
-    }
-
     last_error: str | None = None
     last_status: int | None = None
     last_body_snippet: str | None = None
     for attempt in range(DEFAULT_RETRIES):
         try:
-            request = Request(url, headers=headers)
-            with urlopen(request, timeout=DEFAULT_TIMEOUT_SECONDS) as response:
-                status = getattr(response, "status", None)
-                payload = response.read().decode("utf-8")
-                if status and status != 200:
-                    body_snippet = payload[:300]
-                    logger.error(
-                        "ESPN scoreboard non-200 status=%s body=%s",
-                        status,
-                        body_snippet,
-                    )
-                    return {
-                        "ok": False,
-                        "error": "ESPN returned non-200 response",
-                        "status": status,
-                        "body": body_snippet,
-                        "league": league_key,
-                        "date": normalize_dates(game_date),
-                        "url": url,
-                    }
-                return json.loads(payload)
-        except HTTPError as exc:
-            last_status = exc.code
-            body = exc.read().decode("utf-8") if exc.fp else ""
-            last_body_snippet = body[:300]
+            response = _SESSION.get(url, timeout=DEFAULT_TIMEOUT_SECONDS)
+        except requests.RequestException as exc:
+            last_error = str(exc)
+            if attempt < DEFAULT_RETRIES - 1:
+                time.sleep(DEFAULT_BACKOFF_SECONDS * (2**attempt))
+            continue
+
+        if response.status_code != 200:
+            last_status = response.status_code
+            last_body_snippet = response.text[:300]
+            last_error = "ESPN returned non-200 response"
             logger.error(
-                "ESPN scoreboard HTTPError status=%s body=%s",
+                "ESPN scoreboard non-200 status=%s body=%s",
                 last_status,
                 last_body_snippet,
             )
-            last_error = str(exc)
             if attempt < DEFAULT_RETRIES - 1:
                 time.sleep(DEFAULT_BACKOFF_SECONDS * (2**attempt))
-        except (URLError, TimeoutError, json.JSONDecodeError) as exc:
+            continue
+
+        try:
+            return response.json()
+        except ValueError as exc:
             last_error = str(exc)
             if attempt < DEFAULT_RETRIES - 1:
                 time.sleep(DEFAULT_BACKOFF_SECONDS * (2**attempt))
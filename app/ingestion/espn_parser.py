@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import re
 from datetime import datetime, timezone
 from typing import Any, Iterable
 
 from app.ingestion.schema import GameIngestDTO
 
+# Cheap shape check so malformed dates are rejected without paying for a
+# ValueError raise/catch on every bad event.
+_ISO_START_RE = re.compile(
+    r"\A\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:\d{2})?\Z"
+)
+
 
 def _safe_int(value: Any) -> int | None:
     try:
@@ -17,12 +24,26 @@ def _safe_int(value: Any) -> int | None:
 
 def _parse_start_time(event: dict[str, Any]) -> datetime | None:
     date_value = event.get("date")
-    if isinstance(date_value, str):
-        try:
-            return datetime.fromisoformat(date_value.replace("Z", "+00:00"))
-        except ValueError:
-            pass
-    return None
+    if not isinstance(date_value, str) or not _ISO_START_RE.match(date_value):
+        return None
+    try:
+        return datetime.fromisoformat(date_value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+# Exact state -> normalized status; consulted before the substring fallbacks so
+# the common path is a single dict probe instead of a membership-test ladder.
+_STATE_STATUS: dict[str, str] = {
+    "pre": "scheduled",
+    "scheduled": "scheduled",
+    "in": "in_progress",
+    "in_progress": "in_progress",
+    "in progress": "in_progress",
+    "post": "final",
+    "final": "final",
+    "finals": "final",
+}
 
 
 def _normalize_status(status: dict[str, Any]) -> str:
@@ -30,16 +51,13 @@ def _normalize_status(status: dict[str, Any]) -> str:
     state = status_type.get("state") or status_type.get("name")
     if isinstance(state, str):
         state_lower = state.lower()
+        mapped = _STATE_STATUS.get(state_lower)
+        if mapped is not None:
+            return mapped
         if "postpon" in state_lower:
             return "postponed"
         if "cancel" in state_lower:
             return "canceled"
-        if state_lower in {"pre", "scheduled"}:
-            return "scheduled"
-        if state_lower in {"in", "in_progress", "in progress"}:
-            return "in_progress"
-        if state_lower in {"post", "final", "finals"}:
-            return "final"
     description = status_type.get("description") or ""
     if isinstance(description, str):
         description_lower = description.lower()
@@ -10,7 +10,7 @@ from typing import Iterable
 
 from sqlalchemy.orm import Session
 
-from app.db import Base, SessionLocal, engine
+from app.db import SessionLocal
 from app.ingestion.espn_client import fetch_scoreboard
 from app.ingestion.espn_parser import parse_scoreboard
 from app.ingestion.schema import GameIngestDTO
@@ -117,9 +117,12 @@ def _upsert_games(db: Session, games: Iterable[GameIngestDTO], result: SyncResul
 
 
 def sync_games_for_date(game_date: date, leagues: list[str]) -> SyncResult:
-    """Fetch, parse, and upsert games for the requested date + leagues."""
+    """Fetch, parse, and upsert games for the requested date + leagues.
+
+    Assumes the schema is already migrated (``alembic upgrade head``); no
+    runtime DDL is issued here.
+    """
 
-    Base.metadata.create_all(bind=engine)
     result = SyncResult()
 
     with SessionLocal() as db:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import Counter
 from datetime import date, datetime, timedelta, timezone
 import asyncio
 import json
@@ -8,12 +9,13 @@ import os
 from types import SimpleNamespace
 from zoneinfo import ZoneInfo
 
-from fastapi import Depends, FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from sqlalchemy import desc
-from sqlalchemy.orm import Session
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from sqlalchemy import case, desc, func
+from sqlalchemy.orm import Session, load_only
 
 from app.ai.openai_client import OpenAIClientError, request_pick
 from app.db import get_db
@@ -26,16 +28,39 @@ from app.models import Game, Pick, PickJob
 from app.picks.enqueue import enqueue_due_games
 from app.picks.payload import build_game_payload
 from app.picks.worker import run_worker_with_shutdown
+from pydantic import TypeAdapter
+
 from app.schemas import GameOut, GamesTodayResponse, PickJobOut, PickOut
 from app.settings import encrypt_api_key, get_or_create_settings
 from app.team_logos import team_logo_url, league_logo_url
 
 app = FastAPI(title="Bet Tracker (Local)")
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
-templates = Jinja2Templates(directory="app/templates")
+# Explicit Environment: bytecode cache skips recompiling templates across
+# restarts, and auto_reload (per-request mtime stat) stays off unless asked for.
+_template_env = Environment(
+    loader=FileSystemLoader("app/templates"),
+    autoescape=select_autoescape(["html"]),
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=bool(int(os.getenv("TEMPLATE_AUTORELOAD", "0"))),
+)
+templates = Jinja2Templates(env=_template_env)
 templates.env.globals["team_logo_url"] = team_logo_url
 templates.env.globals["league_logo_url"] = league_logo_url
 logger = logging.getLogger(__name__)
+# Validate whole result lists in one call instead of per-row model_validate.
+_GAMES_ADAPTER = TypeAdapter(list[GameOut])
+_PICKS_ADAPTER = TypeAdapter(list[PickOut])
+_PICK_JOBS_ADAPTER = TypeAdapter(list[PickJobOut])
+# "Today" is defined in US/Eastern everywhere; build the tzinfo objects once.
+_NY_TZ = ZoneInfo("America/New_York")
+_UTC = timezone.utc
+# Contract for /api/picks/save payloads; built once instead of per request.
+_REQUIRED_PICK_FIELDS = frozenset({
+    "result", "market", "emoji", "selection", "line", "odds_format", "odds",
+    "p_est", "p_implied", "ev", "confidence", "stake_u", "high_prob_low_payout",
+    "is_value", "reasons", "risks", "triggers", "missing_data", "as_of_utc", "notes",
+})
 _auto_ingest_task: asyncio.Task | None = None
 _auto_ingest_stop: asyncio.Event | None = None
 _auto_worker_task: asyncio.Task | None = None
@@ -102,6 +127,10 @@ async def start_auto_ingest() -> None:
     global _auto_ingest_task, _auto_ingest_stop, _auto_worker_task, _auto_worker_stop
     install_buffer_handler()
     logger.info("App starting up — initializing auto-ingest and worker")
+    # Compile every template at boot so the first request of each page does
+    # not pay the parse/compile cost (and the bytecode cache gets populated).
+    for template_name in _template_env.list_templates(extensions=["html"]):
+        _template_env.get_template(template_name)
     interval_minutes = int(os.getenv("AUTO_INGEST_INTERVAL_MINUTES", "15"))
     leagues_raw = os.getenv("AUTO_INGEST_LEAGUES", "NBA,NHL")
     leagues = _parse_auto_ingest_leagues(leagues_raw)
@@ -132,23 +161,46 @@ async def stop_auto_ingest() -> None:
 
 @app.get("/", response_class=HTMLResponse)
 def home(request: Request, db: Session = Depends(get_db)):
-    picks = db.query(Pick).order_by(desc(Pick.created_at_utc)).limit(50).all()
+    # index.html reads a fixed column subset; skip hydrating the heavy *_json
+    # Text blobs (raw_ai_json alone dwarfs the rest of the row).
+    picks = (
+        db.query(Pick)
+        .options(
+            load_only(
+                Pick.game_id,
+                Pick.result,
+                Pick.market,
+                Pick.emoji,
+                Pick.selection,
+                Pick.odds,
+                Pick.ev,
+                Pick.confidence,
+                Pick.stake_u,
+                Pick.created_at_utc,
+            )
+        )
+        .order_by(desc(Pick.created_at_utc))
+        .limit(50)
+        .all()
+    )
     game_ids = [pick.game_id for pick in picks]
+    # Rows only feed the id -> game lookup below, so no ORDER BY needed.
     games = (
         db.query(Game)
+        .options(load_only(Game.home_team, Game.away_team, Game.league))
         .filter(Game.id.in_(game_ids))
-        .order_by(Game.start_time_utc.asc())
         .all()
         if game_ids
         else []
     )
     game_lookup = {game.id: game for game in games}
 
+    result_counts = Counter(pick.result for pick in picks)
     stats = {
         "total": len(picks),
-        "bet": sum(1 for pick in picks if pick.result == "BET"),
-        "lean": sum(1 for pick in picks if pick.result == "LEAN"),
-        "no_bet": sum(1 for pick in picks if pick.result == "NO_BET"),
+        "bet": result_counts["BET"],
+        "lean": result_counts["LEAN"],
+        "no_bet": result_counts["NO_BET"],
     }
 
     return templates.TemplateResponse(
@@ -164,7 +216,7 @@ def home(request: Request, db: Session = Depends(get_db)):
 
 
 @app.get("/ui/settings", response_class=HTMLResponse)
-async def settings_page(request: Request, db: Session = Depends(get_db)):
+def settings_page(request: Request, db: Session = Depends(get_db)):
     settings = get_or_create_settings(db)
     has_key = bool(settings.openai_api_key_enc)
     return templates.TemplateResponse(
@@ -214,12 +266,12 @@ async def settings_save(request: Request, db: Session = Depends(get_db)):
 @app.get("/picks", response_model=list[PickOut])
 def list_picks(db: Session = Depends(get_db)):
     picks = db.query(Pick).order_by(desc(Pick.created_at_utc)).all()
-    return [PickOut.model_validate(pick) for pick in picks]
+    return _PICKS_ADAPTER.validate_python(picks, from_attributes=True)
 
 
 @app.get("/picks/{pick_id}", response_model=PickOut)
 def get_pick(pick_id: int, db: Session = Depends(get_db)):
-    pick = db.query(Pick).filter(Pick.id == pick_id).one_or_none()
+    pick = db.get(Pick, pick_id)
     if not pick:
         raise HTTPException(status_code=404, detail="Pick no encontrado")
     return PickOut.model_validate(pick)
@@ -241,12 +293,12 @@ def list_pick_jobs(status: str | None = None, db: Session = Depends(get_db)):
     if status:
         query = query.filter(PickJob.status == status)
     jobs = query.all()
-    return [PickJobOut.model_validate(job) for job in jobs]
+    return _PICK_JOBS_ADAPTER.validate_python(jobs, from_attributes=True)
 
 
 @app.get("/pick-jobs/{job_id}", response_model=PickJobOut)
 def get_pick_job(job_id: int, db: Session = Depends(get_db)):
-    job = db.query(PickJob).filter(PickJob.id == job_id).one_or_none()
+    job = db.get(PickJob, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Pick job no encontrado")
     return PickJobOut.model_validate(job)
@@ -277,7 +329,7 @@ def api_games_today(
     message = "No games found for requested date." if not games else None
 
     return GamesTodayResponse(
-        games=[GameOut.model_validate(game) for game in games],
+        games=_GAMES_ADAPTER.validate_python(games, from_attributes=True),
         date=query_date.isoformat(),
         league=normalized_league,
         count=len(games),
@@ -393,12 +445,7 @@ def api_save_pick(payload: dict, db: Session = Depends(get_db)):
     if not provider_event_id:
         raise HTTPException(status_code=400, detail="event.provider_event_id is required")
 
-    required_pick_fields = {
-        "result", "market", "emoji", "selection", "line", "odds_format", "odds",
-        "p_est", "p_implied", "ev", "confidence", "stake_u", "high_prob_low_payout",
-        "is_value", "reasons", "risks", "triggers", "missing_data", "as_of_utc", "notes",
-    }
-    missing = sorted(required_pick_fields - set(pick_payload.keys()))
+    missing = sorted(_REQUIRED_PICK_FIELDS - pick_payload.keys())
     if missing:
         raise HTTPException(status_code=400, detail=f"pick missing fields: {', '.join(missing)}")
 
@@ -457,6 +504,27 @@ def api_save_pick(payload: dict, db: Session = Depends(get_db)):
     }
 
 
+@app.get("/api/stats")
+def api_stats(request: Request, db: Session = Depends(get_db)):
+    total, bet, lean, no_bet, max_created = db.query(
+        func.count(Pick.id),
+        func.coalesce(func.sum(case((Pick.result == "BET", 1), else_=0)), 0),
+        func.coalesce(func.sum(case((Pick.result == "LEAN", 1), else_=0)), 0),
+        func.coalesce(func.sum(case((Pick.result == "NO_BET", 1), else_=0)), 0),
+        func.max(Pick.created_at_utc),
+    ).one()
+
+    etag = f'"{total}-{max_created.isoformat() if max_created else "0"}"'
+    headers = {"Cache-Control": "max-age=15", "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    return JSONResponse(
+        content={"total": total, "bet": bet, "lean": lean, "no_bet": no_bet},
+        headers=headers,
+    )
+
+
 @app.get("/api/logs")
 def api_logs(limit: int = 100):
     handler = get_buffer_handler()
@@ -476,7 +544,7 @@ def espn_scoreboard_page(request: Request):
 
 def parse_query_date(value: str | None) -> date:
     if not value:
-        return datetime.now(ZoneInfo("America/New_York")).date()
+        return datetime.now(_NY_TZ).date()
     try:
         return date.fromisoformat(value)
     except ValueError as exc:
@@ -484,10 +552,9 @@ def parse_query_date(value: str | None) -> date:
 
 
 def ny_date_range_utc(day: date) -> tuple[datetime, datetime]:
-    ny_tz = ZoneInfo("America/New_York")
-    start_local = datetime.combine(day, datetime.min.time(), tzinfo=ny_tz)
+    start_local = datetime.combine(day, datetime.min.time(), tzinfo=_NY_TZ)
     end_local = start_local + timedelta(days=1)
-    return start_local.astimezone(ZoneInfo("UTC")), end_local.astimezone(ZoneInfo("UTC"))
+    return start_local.astimezone(_UTC), end_local.astimezone(_UTC)
 
 
 def _parse_event_start(value: str | None) -> datetime | None:
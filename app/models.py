@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, UniqueConstraint, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Index, UniqueConstraint, Boolean
 from sqlalchemy.sql import func
 from .db import Base
 
@@ -32,6 +32,7 @@ class Game(Base):
     __tablename__ = "games"
     __table_args__ = (
         UniqueConstraint("provider", "provider_event_id", name="uq_games_provider_event_id"),
+        Index("ix_games_start_time_utc_league", "start_time_utc", "league"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -72,6 +73,9 @@ class PickJob(Base):
     __tablename__ = "pick_jobs"
     __table_args__ = (
         UniqueConstraint("game_id", name="uq_pick_jobs_game_id"),
+        # Claim and stale-recovery queries filter on status plus a time bound.
+        Index("ix_pick_jobs_status_run_at", "status", "run_at_utc"),
+        Index("ix_pick_jobs_status_locked_at_utc", "status", "locked_at_utc"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -88,6 +92,10 @@ class PickJob(Base):
 
 class Pick(Base):
     __tablename__ = "picks"
+    __table_args__ = (
+        Index("ix_picks_game_id", "game_id"),
+        Index("ix_picks_created_at_utc", "created_at_utc"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     game_id = Column(Integer, ForeignKey("games.id"), nullable=False)
@@ -12,6 +12,10 @@ from app.models import Game, Pick, PickJob
 
 logger = logging.getLogger(__name__)
 
+# Frozen at import so membership stays O(1) regardless of how LEAGUE_PATHS
+# is represented upstream.
+_LEAGUE_KEYS: frozenset[str] = frozenset(LEAGUE_PATHS)
+
 
 def _ensure_utc(value: datetime) -> datetime:
     if value.tzinfo is None:
@@ -21,7 +25,7 @@ def _ensure_utc(value: datetime) -> datetime:
 
 def _parse_leagues(raw: str) -> list[str]:
     leagues = [league.strip().upper() for league in raw.split(",") if league.strip()]
-    invalid = [league for league in leagues if league not in LEAGUE_PATHS]
+    invalid = [league for league in leagues if league not in _LEAGUE_KEYS]
     if invalid:
         raise ValueError(f"Unsupported leagues: {', '.join(invalid)}")
     return leagues
@@ -39,7 +43,14 @@ def _enqueue_for_game(
     *,
     now: datetime | None = None,
     pregame_window_hours: int = 2,
+    picked_game_ids: set[int] | None = None,
+    existing_jobs: dict[int, PickJob] | None = None,
 ) -> bool:
+    """Enqueue one game, using prefetched pick/job lookups when provided.
+
+    ``picked_game_ids`` and ``existing_jobs`` let batch callers avoid the two
+    per-game existence SELECTs; when omitted, the queries are issued here.
+    """
     if not game.start_time_utc:
         return False
     if game.status.lower() != "scheduled":
@@ -51,13 +62,21 @@ def _enqueue_for_game(
     if not (window_start <= now_utc <= game_start_utc):
         return False
 
-    existing_pick = db.query(Pick).filter(Pick.game_id == game.id).one_or_none()
-    if existing_pick is not None:
+    if picked_game_ids is not None:
+        has_pick = game.id in picked_game_ids
+    else:
+        has_pick = (
+            db.query(Pick).filter(Pick.game_id == game.id).one_or_none() is not None
+        )
+    if has_pick:
         return False
 
     run_at = now_utc
 
-    existing = db.query(PickJob).filter(PickJob.game_id == game.id).one_or_none()
+    if existing_jobs is not None:
+        existing = existing_jobs.get(game.id)
+    else:
+        existing = db.query(PickJob).filter(PickJob.game_id == game.id).one_or_none()
     if existing:
         if existing.status != "failed":
             return False
@@ -85,8 +104,27 @@ def _enqueue_for_game(
     return True
 
 
+def _prefetch_enqueue_state(
+    db: Session, games: list[Game]
+) -> tuple[set[int], dict[int, PickJob]]:
+    """Load existing picks/jobs for all candidate games in two queries."""
+    game_ids = [game.id for game in games]
+    if not game_ids:
+        return set(), {}
+    picked_game_ids = {
+        game_id
+        for (game_id,) in db.query(Pick.game_id).filter(Pick.game_id.in_(game_ids))
+    }
+    existing_jobs = {
+        job.game_id: job
+        for job in db.query(PickJob).filter(PickJob.game_id.in_(game_ids))
+    }
+    return picked_game_ids, existing_jobs
+
+
 def enqueue_for_date(target_date: date, leagues: list[str]) -> int:
     start_utc, end_utc = _utc_day_range(target_date)
+    now = datetime.now(timezone.utc)
     created = 0
     with SessionLocal() as db:
         query = db.query(Game).filter(
@@ -98,8 +136,15 @@ def enqueue_for_date(target_date: date, leagues: list[str]) -> int:
         if leagues:
             query = query.filter(Game.league.in_(leagues))
         games = query.order_by(Game.start_time_utc.asc()).all()
+        picked_game_ids, existing_jobs = _prefetch_enqueue_state(db, games)
         for game in games:
-            if _enqueue_for_game(db, game):
+            if _enqueue_for_game(
+                db,
+                game,
+                now=now,
+                picked_game_ids=picked_game_ids,
+                existing_jobs=existing_jobs,
+            ):
                 created += 1
         db.commit()
     return created
@@ -124,8 +169,16 @@ def enqueue_due_games(leagues: list[str], horizon_hours: int = 2) -> int:
         if leagues:
             query = query.filter(Game.league.in_(leagues))
         games = query.order_by(Game.start_time_utc.asc()).all()
+        picked_game_ids, existing_jobs = _prefetch_enqueue_state(db, games)
         for game in games:
-            if _enqueue_for_game(db, game, now=now, pregame_window_hours=horizon_hours):
+            if _enqueue_for_game(
+                db,
+                game,
+                now=now,
+                pregame_window_hours=horizon_hours,
+                picked_game_ids=picked_game_ids,
+                existing_jobs=existing_jobs,
+            ):
                 created += 1
         db.commit()
     return created
@@ -1,64 +1,151 @@
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 import json
 import logging
 import os
+import random
 import socket
-import traceback
+import time
+
+from sqlalchemy import and_, case, func, insert, select, update
+from sqlalchemy.orm import load_only
 
 from app.ai.openai_client import OpenAIClientError, request_pick
 from app.db import SessionLocal
-from app.models import Game, Pick, PickJob
+from app.models import AppSettings, Game, Pick, PickJob
 from app.picks.payload import build_game_payload
-from app.settings import get_or_create_settings, snapshot_settings
+from app.settings import SettingsSnapshot, get_or_create_settings, snapshot_settings
 
 logger = logging.getLogger(__name__)
 
 # Running jobs older than this timeout are considered orphaned and re-queued.
 _RUNNING_STALE_TIMEOUT_SECONDS = 15 * 60
 
+# Ceiling for the idle backoff; the poll interval is the floor, doubling per
+# consecutive empty poll, and any claimed job resets it.
+_IDLE_SLEEP_CAP_SECONDS = 300
+
+# Ceiling for the per-job retry backoff (before jitter).
+_RETRY_BACKOFF_CAP_SECONDS = 300
+
+# Stable for the process lifetime, so computed once at import.
+_LOCK_OWNER = f"{socket.gethostname()}:{os.getpid()}"
+
+# Settings change rarely; re-reading them on every poll is wasted traffic.
+# Edits in the UI take at most this long to reach the worker, and after the
+# TTL only the updated_at_utc column is checked before reusing the snapshot.
+_SETTINGS_CACHE_TTL_SECONDS = 30.0
+_settings_cache: tuple[float, datetime | None, SettingsSnapshot] | None = None
+
+# Dedicated pool for job processing so the worker never competes with the
+# web app's asyncio.to_thread traffic on the shared default executor.
+_job_executor: tuple[int, ThreadPoolExecutor] | None = None
+
+
+def _get_job_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Return the job thread pool, rebuilding it if concurrency changed."""
+    global _job_executor
+    if _job_executor is None or _job_executor[0] != max_workers:
+        if _job_executor is not None:
+            _job_executor[1].shutdown(wait=False)
+        _job_executor = (
+            max_workers,
+            ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="pickworker"
+            ),
+        )
+    return _job_executor[1]
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def _claim_jobs(concurrency: int, lock_owner: str) -> list[int]:
-    now = _utcnow()
+def _get_settings_snapshot(
+    ttl_seconds: float = _SETTINGS_CACHE_TTL_SECONDS,
+) -> SettingsSnapshot:
+    """Return the settings snapshot, revalidating against the DB per TTL.
+
+    Within the TTL the cached snapshot is returned outright; after it, a
+    single-column read of ``updated_at_utc`` decides whether the full row
+    needs re-fetching.
+    """
+    global _settings_cache
+    now = time.monotonic()
+    if _settings_cache is not None and now - _settings_cache[0] < ttl_seconds:
+        return _settings_cache[2]
     with SessionLocal() as db:
-        # Count total queued jobs for visibility
-        total_queued = db.query(PickJob).filter(PickJob.status == "queued").count()
-        eligible = db.query(PickJob).filter(
-            PickJob.status == "queued",
-            PickJob.run_at_utc <= now,
-        ).count()
-        logger.debug(
-            "Job check: total_queued=%d eligible_now=%d (concurrency=%d)",
-            total_queued, eligible, concurrency,
-        )
+        if _settings_cache is not None:
+            updated_at = (
+                db.query(AppSettings.updated_at_utc)
+                .filter(AppSettings.id == 1)
+                .scalar()
+            )
+            if updated_at is not None and updated_at == _settings_cache[1]:
+                _settings_cache = (now, updated_at, _settings_cache[2])
+                return _settings_cache[2]
+        settings = get_or_create_settings(db)
+        snapshot = snapshot_settings(settings)
+        _settings_cache = (now, settings.updated_at_utc, snapshot)
+    return snapshot
+
+
+def _claim_jobs(concurrency: int, lock_owner: str) -> list[tuple[int, int, int]]:
+    """Atomically claim eligible jobs; returns (id, game_id, attempts) rows.
 
-        jobs = (
-            db.query(PickJob)
-            .filter(
-                PickJob.status == "queued",
-                PickJob.run_at_utc <= now,
+    Returning the processing inputs straight from the claim saves the
+    per-job PickJob re-read in ``_process_job_sync``.
+    """
+    now = _utcnow()
+    with SessionLocal() as db:
+        if logger.isEnabledFor(logging.DEBUG):
+            # One scan for both visibility counters instead of two COUNT queries.
+            total_queued, eligible = (
+                db.query(
+                    func.count(PickJob.id),
+                    func.coalesce(
+                        func.sum(case((PickJob.run_at_utc <= now, 1), else_=0)), 0
+                    ),
+                )
+                .filter(PickJob.status == "queued")
+                .one()
+            )
+            logger.debug(
+                "Job check: total_queued=%d eligible_now=%d (concurrency=%d)",
+                total_queued, eligible, concurrency,
             )
+
+        # Atomic claim: one UPDATE ... RETURNING instead of SELECT-then-mutate,
+        # so no other claimer can grab the same rows between statements.
+        eligible_ids = (
+            select(PickJob.id)
+            .where(PickJob.status == "queued", PickJob.run_at_utc <= now)
             .order_by(PickJob.run_at_utc.asc())
             .limit(concurrency)
-            .all()
+            .scalar_subquery()
+        )
+        result = db.execute(
+            update(PickJob)
+            .where(PickJob.id.in_(eligible_ids))
+            .values(
+                status="running",
+                locked_at_utc=now,
+                lock_owner=lock_owner,
+                updated_at_utc=now,
+            )
+            .returning(PickJob.id, PickJob.game_id, PickJob.attempts)
+            .execution_options(synchronize_session=False)
         )
-        job_ids: list[int] = []
-        for job in jobs:
-            job.status = "running"
-            job.locked_at_utc = now
-            job.lock_owner = lock_owner
-            job.updated_at_utc = now
-            job_ids.append(job.id)
+        claimed = [tuple(row) for row in result]
         db.commit()
-        if job_ids:
-            logger.info("Claimed %d job(s): %s", len(job_ids), job_ids)
-    return job_ids
+        if claimed:
+            logger.info(
+                "Claimed %d job(s): %s", len(claimed), [job_id for job_id, _, _ in claimed]
+            )
+    return claimed
 
 
 def _format_dt(value: datetime | None) -> str:
@@ -71,21 +158,34 @@ def _format_dt(value: datetime | None) -> str:
 
 def _queue_snapshot() -> dict[str, str | int]:
     now = _utcnow()
+    queued_filter = PickJob.status == "queued"
     with SessionLocal() as db:
-        total = db.query(PickJob).count()
-        queued = db.query(PickJob).filter(PickJob.status == "queued").count()
-        eligible = db.query(PickJob).filter(
-            PickJob.status == "queued",
-            PickJob.run_at_utc <= now,
-        ).count()
-        running = db.query(PickJob).filter(PickJob.status == "running").count()
-        failed = db.query(PickJob).filter(PickJob.status == "failed").count()
-        done = db.query(PickJob).filter(PickJob.status == "done").count()
-        next_job = (
-            db.query(PickJob)
-            .filter(PickJob.status == "queued")
-            .order_by(PickJob.run_at_utc.asc())
-            .first()
+        # Conditional aggregation: one scan instead of six COUNT/first queries.
+        total, queued, eligible, running, failed, done, next_run_at = (
+            db.query(
+                func.count(PickJob.id),
+                func.coalesce(func.sum(case((queued_filter, 1), else_=0)), 0),
+                func.coalesce(
+                    func.sum(
+                        case(
+                            (and_(queued_filter, PickJob.run_at_utc <= now), 1),
+                            else_=0,
+                        )
+                    ),
+                    0,
+                ),
+                func.coalesce(
+                    func.sum(case((PickJob.status == "running", 1), else_=0)), 0
+                ),
+                func.coalesce(
+                    func.sum(case((PickJob.status == "failed", 1), else_=0)), 0
+                ),
+                func.coalesce(
+                    func.sum(case((PickJob.status == "done", 1), else_=0)), 0
+                ),
+                func.min(case((queued_filter, PickJob.run_at_utc))),
+            )
+            .one()
         )
 
     return {
@@ -95,7 +195,7 @@ def _queue_snapshot() -> dict[str, str | int]:
         "running": running,
         "done": done,
         "failed": failed,
-        "next_queued_run_at": _format_dt(next_job.run_at_utc if next_job else None),
+        "next_queued_run_at": _format_dt(next_run_at),
         "now_utc": _format_dt(now),
     }
 
@@ -105,30 +205,32 @@ def _requeue_stale_running_jobs(current_lock_owner: str) -> int:
     now = _utcnow()
     stale_before = now.timestamp() - _RUNNING_STALE_TIMEOUT_SECONDS
     stale_before_dt = datetime.fromtimestamp(stale_before, tz=timezone.utc)
-    recovered = 0
 
     with SessionLocal() as db:
-        stale_jobs = (
-            db.query(PickJob)
-            .filter(
+        # One set-based UPDATE instead of SELECT + per-row mutation; the
+        # previous owner is folded into last_error inside the statement.
+        result = db.execute(
+            update(PickJob)
+            .where(
                 PickJob.status == "running",
                 PickJob.locked_at_utc.isnot(None),
                 PickJob.locked_at_utc <= stale_before_dt,
             )
-            .all()
-        )
-        for job in stale_jobs:
-            previous_owner = job.lock_owner or "unknown"
-            job.status = "queued"
-            job.run_at_utc = now
-            job.locked_at_utc = None
-            job.lock_owner = None
-            job.last_error = (
-                f"Recovered stale running job from lock_owner={previous_owner} "
-                f"by lock_owner={current_lock_owner}"
+            .values(
+                status="queued",
+                run_at_utc=now,
+                locked_at_utc=None,
+                lock_owner=None,
+                last_error=(
+                    "Recovered stale running job from lock_owner="
+                    + func.coalesce(PickJob.lock_owner, "unknown")
+                    + f" by lock_owner={current_lock_owner}"
+                ),
+                updated_at_utc=now,
             )
-            job.updated_at_utc = now
-            recovered += 1
+            .execution_options(synchronize_session=False)
+        )
+        recovered = result.rowcount
 
         if recovered:
             db.commit()
@@ -158,6 +260,13 @@ def _coerce_no_odds(ai_payload: dict, missing_label: str = "odds") -> dict:
     return ai_payload
 
 
+def _is_in_pregame_window_epoch(
+    start_epoch: float, now_epoch: float, window_seconds: float = 2 * 3600
+) -> bool:
+    """Window check on epoch seconds: one subtraction, no datetime allocs."""
+    return -window_seconds <= now_epoch - start_epoch <= 0
+
+
 def _is_in_pregame_window(
     game_start_utc: datetime | None,
     *,
@@ -168,190 +277,254 @@ def _is_in_pregame_window(
         return False
     if game_start_utc.tzinfo is None:
         game_start_utc = game_start_utc.replace(tzinfo=timezone.utc)
-    game_start_utc = game_start_utc.astimezone(timezone.utc)
-    window_start = game_start_utc - timedelta(hours=pregame_window_hours)
-    return window_start <= now_utc <= game_start_utc
+    return _is_in_pregame_window_epoch(
+        game_start_utc.timestamp(),
+        now_utc.timestamp(),
+        pregame_window_hours * 3600,
+    )
+
+
+def _upsert_pick(
+    db, game_id: int, ai_payload: dict, raw_ai_json: str, now: datetime | None = None
+) -> None:
+    if now is None:
+        now = _utcnow()
+    # One Core INSERT; the claim path guarantees a single writer per game,
+    # so there is no existing row to conflict with.
+    db.execute(
+        insert(Pick).values(
+            game_id=game_id,
+            created_at_utc=now,
+            result=ai_payload["result"],
+            market=ai_payload["market"],
+            emoji=ai_payload["emoji"],
+            selection=ai_payload["selection"],
+            line=ai_payload["line"],
+            odds_format=ai_payload["odds_format"],
+            odds=ai_payload["odds"],
+            p_est=ai_payload["p_est"],
+            p_implied=ai_payload["p_implied"],
+            ev=ai_payload["ev"],
+            confidence=ai_payload["confidence"],
+            stake_u=ai_payload["stake_u"],
+            high_prob_low_payout=ai_payload["high_prob_low_payout"],
+            is_value=ai_payload["is_value"],
+            reasons_json=json.dumps(ai_payload["reasons"], ensure_ascii=False),
+            risks_json=json.dumps(ai_payload["risks"], ensure_ascii=False),
+            triggers_json=json.dumps(ai_payload["triggers"], ensure_ascii=False),
+            missing_data_json=json.dumps(
+                ai_payload["missing_data"], ensure_ascii=False
+            ),
+            as_of_utc=ai_payload["as_of_utc"],
+            notes=ai_payload["notes"],
+            raw_ai_json=raw_ai_json,
+            updated_at_utc=now,
+        )
+    )
 
 
-def _upsert_pick(db, game_id: int, ai_payload: dict, raw_ai_json: str) -> None:
-    now = _utcnow()
-    pick = Pick(game_id=game_id, created_at_utc=now)
-    db.add(pick)
-
-    pick.result = ai_payload["result"]
-    pick.market = ai_payload["market"]
-    pick.emoji = ai_payload["emoji"]
-    pick.selection = ai_payload["selection"]
-    pick.line = ai_payload["line"]
-    pick.odds_format = ai_payload["odds_format"]
-    pick.odds = ai_payload["odds"]
-    pick.p_est = ai_payload["p_est"]
-    pick.p_implied = ai_payload["p_implied"]
-    pick.ev = ai_payload["ev"]
-    pick.confidence = ai_payload["confidence"]
-    pick.stake_u = ai_payload["stake_u"]
-    pick.high_prob_low_payout = ai_payload["high_prob_low_payout"]
-    pick.is_value = ai_payload["is_value"]
-    pick.reasons_json = json.dumps(ai_payload["reasons"], ensure_ascii=False)
-    pick.risks_json = json.dumps(ai_payload["risks"], ensure_ascii=False)
-    pick.triggers_json = json.dumps(ai_payload["triggers"], ensure_ascii=False)
-    pick.missing_data_json = json.dumps(ai_payload["missing_data"], ensure_ascii=False)
-    pick.as_of_utc = ai_payload["as_of_utc"]
-    pick.notes = ai_payload["notes"]
-    pick.raw_ai_json = raw_ai_json
-    pick.updated_at_utc = now
-
-
-def _process_job_sync(job_id: int, settings_snapshot, lock_owner: str) -> None:
-    logger.info("Processing job #%d ...", job_id)
-    with SessionLocal() as db:
-        job = db.query(PickJob).filter(PickJob.id == job_id).one_or_none()
-        if not job or job.status != "running" or job.lock_owner != lock_owner:
-            logger.warning("Job #%d: skipped (status=%s, owner=%s)",
-                           job_id, job.status if job else "N/A", job.lock_owner if job else "N/A")
-            return
+def _mark_job_done_skipped(db, job_id: int, reason: str, now: datetime) -> None:
+    db.execute(
+        update(PickJob)
+        .where(PickJob.id == job_id)
+        .values(status="done", last_error=reason, updated_at_utc=now)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
 
-        try:
-            game = db.query(Game).filter(Game.id == job.game_id).one_or_none()
+
+def _process_job_sync(
+    job_id: int, game_id: int, attempts: int, settings_snapshot, lock_owner: str
+) -> None:
+    logger.info("Processing job #%d ...", job_id)
+    try:
+        # Phase A: short session for validation and payload build; closed
+        # before the multi-second OpenAI call so no DB connection sits idle
+        # waiting on HTTP. The job row itself is not re-read — the claim
+        # already returned its id, game_id, and attempts.
+        with SessionLocal() as db:
+            # Only the eligibility-check and payload columns; skips the
+            # raw_json blob the worker never reads.
+            game = db.get(
+                Game,
+                game_id,
+                options=[
+                    load_only(
+                        Game.provider,
+                        Game.status,
+                        Game.start_time_utc,
+                        Game.sport,
+                        Game.league,
+                        Game.home_team,
+                        Game.away_team,
+                    )
+                ],
+            )
             if not game:
                 raise RuntimeError("Game not found for job.")
 
             now_utc = _utcnow()
             if game.provider != "espn":
                 logger.info("Job #%d: non-ESPN game #%d skipped", job_id, game.id)
-                job.status = "done"
-                job.last_error = "Skipped non-ESPN game"
-                job.updated_at_utc = now_utc
-                db.commit()
+                _mark_job_done_skipped(db, job_id, "Skipped non-ESPN game", now_utc)
                 return
 
             if game.status.lower() != "scheduled":
                 logger.info("Job #%d: game status=%s skipped", job_id, game.status)
-                job.status = "done"
-                job.last_error = f"Skipped game status={game.status}"
-                job.updated_at_utc = now_utc
-                db.commit()
+                _mark_job_done_skipped(
+                    db, job_id, f"Skipped game status={game.status}", now_utc
+                )
                 return
 
             if not _is_in_pregame_window(game.start_time_utc, now_utc=now_utc):
                 logger.info("Job #%d: game outside pregame window, skipped", job_id)
-                job.status = "done"
-                job.last_error = "Skipped game outside pregame window"
-                job.updated_at_utc = now_utc
-                db.commit()
+                _mark_job_done_skipped(
+                    db, job_id, "Skipped game outside pregame window", now_utc
+                )
                 return
 
             logger.info("Job #%d: game=%s vs %s (%s) start=%s",
                         job_id, game.home_team, game.away_team, game.league,
                         game.start_time_utc)
-
-            logger.info("Job #%d: calling OpenAI (model=%s, effort=%s) ...",
-                        job_id, settings_snapshot.openai_model, settings_snapshot.openai_reasoning_effort)
             payload = build_game_payload(game, settings_snapshot)
-            ai_response, raw_ai_json = request_pick(payload, settings_snapshot)
 
-            if payload["odds"] is None:
-                logger.info("Job #%d: no odds available, coercing to NO_BET", job_id)
-                ai_response = _coerce_no_odds(ai_response)
+        # Phase B: no session held during the OpenAI round-trip.
+        logger.info("Job #%d: calling OpenAI (model=%s, effort=%s) ...",
+                    job_id, settings_snapshot.openai_model, settings_snapshot.openai_reasoning_effort)
+        ai_response, raw_ai_json = request_pick(payload, settings_snapshot)
 
-            picks = ai_response.get("picks") if isinstance(ai_response, dict) else None
-            if not isinstance(picks, list) or not picks:
-                raise OpenAIClientError("AI response missing picks array")
+        if payload["odds"] is None:
+            logger.info("Job #%d: no odds available, coercing to NO_BET", job_id)
+            ai_response = _coerce_no_odds(ai_response)
 
-            selected_pick = next((p for p in picks if isinstance(p, dict) and p.get("result") != "NO_BET"), None)
-            if selected_pick is None:
-                selected_pick = next((p for p in picks if isinstance(p, dict)), None)
-            if selected_pick is None:
-                raise OpenAIClientError("AI response had no valid pick objects")
+        picks = ai_response.get("picks") if isinstance(ai_response, dict) else None
+        if not isinstance(picks, list) or not picks:
+            raise OpenAIClientError("AI response missing picks array")
 
-            _upsert_pick(db, game.id, selected_pick, raw_ai_json)
-            logger.info("Job #%d: pick saved -> result=%s market=%s confidence=%s ev=%s",
-                        job_id, selected_pick.get("result"), selected_pick.get("market"),
-                        selected_pick.get("confidence"), selected_pick.get("ev"))
+        selected_pick = next((p for p in picks if isinstance(p, dict) and p.get("result") != "NO_BET"), None)
+        if selected_pick is None:
+            selected_pick = next((p for p in picks if isinstance(p, dict)), None)
+        if selected_pick is None:
+            raise OpenAIClientError("AI response had no valid pick objects")
 
-            job.status = "done"
-            job.updated_at_utc = _utcnow()
+        # Phase C: short session to write the pick and mark the job done,
+        # re-checking ownership in the WHERE clause.
+        with SessionLocal() as db:
+            now = _utcnow()
+            _upsert_pick(db, game_id, selected_pick, raw_ai_json, now=now)
+            db.execute(
+                update(PickJob)
+                .where(PickJob.id == job_id, PickJob.lock_owner == lock_owner)
+                .values(status="done", updated_at_utc=now)
+                .execution_options(synchronize_session=False)
+            )
             db.commit()
-        except Exception as exc:
-            exc_name = type(exc).__name__
-            exc_message = str(exc).strip() or "(no message)"
-            error_summary = f"{exc_name}: {exc_message}"
-            logger.error("Job #%d FAILED: %s", job_id, error_summary, exc_info=True)
-            db.rollback()
-            job = db.query(PickJob).filter(PickJob.id == job_id).one_or_none()
-            if not job:
-                return
-            job.attempts += 1
-            job.last_error = error_summary
-            job.updated_at_utc = _utcnow()
-            if job.attempts <= settings_snapshot.auto_picks_max_retries:
-                job.status = "queued"
-                job.run_at_utc = _utcnow()
-                logger.warning(
-                    "Job #%d re-queued (%d/%d attempts) due to %s",
-                    job_id,
-                    job.attempts,
-                    settings_snapshot.auto_picks_max_retries,
-                    error_summary,
-                )
-            else:
-                job.status = "failed"
-                trace_tail = traceback.format_exc(limit=6).strip().replace("\n", " | ")
-                logger.error(
-                    "Job #%d exhausted retries (%d/%d) | last_error=%s | trace=%s",
-                    job_id,
-                    job.attempts,
-                    settings_snapshot.auto_picks_max_retries,
-                    error_summary,
-                    trace_tail,
+        logger.info("Job #%d: pick saved -> result=%s market=%s confidence=%s ev=%s",
+                    job_id, selected_pick.get("result"), selected_pick.get("market"),
+                    selected_pick.get("confidence"), selected_pick.get("ev"))
+    except Exception as exc:
+        exc_name = type(exc).__name__
+        exc_message = str(exc).strip() or "(no message)"
+        error_summary = f"{exc_name}: {exc_message}"
+        logger.error("Job #%d FAILED: %s", job_id, error_summary, exc_info=True)
+        attempts += 1
+        now = _utcnow()
+        if attempts <= settings_snapshot.auto_picks_max_retries:
+            # Exponential backoff with jitter so a flapping OpenAI endpoint
+            # is not hammered on the very next poll.
+            delay = min(_RETRY_BACKOFF_CAP_SECONDS, 2 ** attempts) + random.uniform(0, 5)
+            retry_values = {
+                "status": "queued",
+                "run_at_utc": now + timedelta(seconds=delay),
+            }
+            logger.warning(
+                "Job #%d re-queued (%d/%d attempts, retry in %.0fs) due to %s",
+                job_id,
+                attempts,
+                settings_snapshot.auto_picks_max_retries,
+                delay,
+                error_summary,
+            )
+        else:
+            retry_values = {"status": "failed"}
+            # The full traceback was already logged above via exc_info=True.
+            logger.error(
+                "Job #%d exhausted retries (%d/%d) | last_error=%s",
+                job_id,
+                attempts,
+                settings_snapshot.auto_picks_max_retries,
+                error_summary,
+            )
+        with SessionLocal() as db:
+            db.execute(
+                update(PickJob)
+                .where(PickJob.id == job_id)
+                .values(
+                    attempts=attempts,
+                    last_error=error_summary,
+                    locked_at_utc=None,
+                    lock_owner=None,
+                    updated_at_utc=now,
+                    **retry_values,
                 )
-            job.locked_at_utc = None
-            job.lock_owner = None
+                .execution_options(synchronize_session=False)
+            )
             db.commit()
 
 
-async def _process_job(job_id: int, settings_snapshot, lock_owner: str, semaphore: asyncio.Semaphore) -> None:
-    async with semaphore:
-        await asyncio.to_thread(_process_job_sync, job_id, settings_snapshot, lock_owner)
+async def _process_job(
+    job: tuple[int, int, int], settings_snapshot, lock_owner: str
+) -> None:
+    job_id, game_id, attempts = job
+    executor = _get_job_executor(settings_snapshot.auto_picks_concurrency)
+    await asyncio.get_running_loop().run_in_executor(
+        executor, _process_job_sync, job_id, game_id, attempts, settings_snapshot, lock_owner
+    )
 
 
 async def run_worker() -> None:
-    hostname = socket.gethostname()
-    pid = os.getpid()
-    lock_owner = f"{hostname}:{pid}"
+    lock_owner = _LOCK_OWNER
+    in_flight: set[asyncio.Task] = set()
 
     while True:
-        with SessionLocal() as db:
-            settings = get_or_create_settings(db)
-            settings_snapshot = snapshot_settings(settings)
+        settings_snapshot = _get_settings_snapshot()
+
+        # Claim only for free slots so a slow job never stalls its peers;
+        # finished tasks free their slot for the next claim immediately.
+        in_flight = {task for task in in_flight if not task.done()}
+        available = settings_snapshot.auto_picks_concurrency - len(in_flight)
+        claimed = _claim_jobs(available, lock_owner) if available > 0 else []
+        for job in claimed:
+            in_flight.add(
+                asyncio.create_task(
+                    _process_job(job, settings_snapshot, lock_owner)
+                )
+            )
 
-        job_ids = _claim_jobs(settings_snapshot.auto_picks_concurrency, lock_owner)
-        if not job_ids:
+        if not in_flight:
             await asyncio.sleep(settings_snapshot.auto_picks_poll_seconds)
             continue
 
-        semaphore = asyncio.Semaphore(settings_snapshot.auto_picks_concurrency)
-        tasks = [
-            asyncio.create_task(_process_job(job_id, settings_snapshot, lock_owner, semaphore))
-            for job_id in job_ids
-        ]
-        await asyncio.gather(*tasks)
+        # Wake as soon as any job finishes (or the poll interval elapses) so
+        # the freed slot is refilled without waiting on the whole batch.
+        await asyncio.wait(
+            in_flight,
+            timeout=settings_snapshot.auto_picks_poll_seconds,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
 
 
 async def run_worker_with_shutdown(stop_event: asyncio.Event) -> None:
     """Run worker loop until stop_event is set."""
-    hostname = socket.gethostname()
-    pid = os.getpid()
-    lock_owner = f"{hostname}:{pid}"
+    lock_owner = _LOCK_OWNER
     logger.info("Worker started (lock_owner=%s)", lock_owner)
     idle_polls = 0
+    in_flight: set[asyncio.Task] = set()
 
     while not stop_event.is_set():
-        with SessionLocal() as db:
-            settings = get_or_create_settings(db)
-            settings_snapshot = snapshot_settings(settings)
-            has_key = bool(settings_snapshot.openai_api_key_enc)
-            picks_enabled = bool(settings_snapshot.auto_picks_enabled)
+        settings_snapshot = _get_settings_snapshot()
+        has_key = bool(settings_snapshot.openai_api_key_enc)
+        picks_enabled = bool(settings_snapshot.auto_picks_enabled)
 
         if not picks_enabled:
             logger.warning("Worker poll: auto_picks_enabled=false — worker idle")
@@ -384,9 +557,27 @@ async def run_worker_with_shutdown(stop_event: asyncio.Event) -> None:
 
         _requeue_stale_running_jobs(lock_owner)
 
-        job_ids = _claim_jobs(settings_snapshot.auto_picks_concurrency, lock_owner)
-        if not job_ids:
+        # Claim only for free slots so one slow job never stalls its peers;
+        # each finished task frees a slot for the next claim.
+        in_flight = {task for task in in_flight if not task.done()}
+        available = settings_snapshot.auto_picks_concurrency - len(in_flight)
+        claimed = _claim_jobs(available, lock_owner) if available > 0 else []
+        for job in claimed:
+            in_flight.add(
+                asyncio.create_task(
+                    _process_job(job, settings_snapshot, lock_owner)
+                )
+            )
+
+        if not in_flight:
             idle_polls += 1
+            # Back off exponentially while the queue stays empty; the poll
+            # interval is the floor and any claimed job resets the counter.
+            poll_seconds = settings_snapshot.auto_picks_poll_seconds
+            idle_sleep = min(
+                poll_seconds * 2 ** min(idle_polls - 1, 8),
+                max(poll_seconds, _IDLE_SLEEP_CAP_SECONDS),
+            )
             if idle_polls == 1 or idle_polls % 10 == 0:
                 snapshot = _queue_snapshot()
                 logger.info(
@@ -402,24 +593,29 @@ async def run_worker_with_shutdown(stop_event: asyncio.Event) -> None:
                     snapshot["now_utc"],
                 )
             else:
-                logger.debug("No eligible jobs, sleeping %ds ...", settings_snapshot.auto_picks_poll_seconds)
+                logger.debug("No eligible jobs, sleeping %ds ...", idle_sleep)
             try:
-                await asyncio.wait_for(
-                    stop_event.wait(),
-                    timeout=settings_snapshot.auto_picks_poll_seconds,
-                )
+                await asyncio.wait_for(stop_event.wait(), timeout=idle_sleep)
             except asyncio.TimeoutError:
                 continue
             continue
 
         idle_polls = 0
 
-        semaphore = asyncio.Semaphore(settings_snapshot.auto_picks_concurrency)
-        tasks = [
-            asyncio.create_task(_process_job(job_id, settings_snapshot, lock_owner, semaphore))
-            for job_id in job_ids
-        ]
-        await asyncio.gather(*tasks)
+        # Wake as soon as any job finishes, the stop event fires, or the
+        # poll interval elapses — no per-batch gather barrier.
+        stop_waiter = asyncio.create_task(stop_event.wait())
+        try:
+            await asyncio.wait(
+                in_flight | {stop_waiter},
+                timeout=settings_snapshot.auto_picks_poll_seconds,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            stop_waiter.cancel()
+
+    if in_flight:
+        await asyncio.gather(*in_flight)
     logger.info("Worker stopped.")
 
 
@@ -1,5 +1,5 @@
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 
@@ -30,8 +30,7 @@ class PickOut(BaseModel):
     created_at_utc: Optional[datetime]
     updated_at_utc: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PickJobOut(BaseModel):
@@ -46,8 +45,7 @@ class PickJobOut(BaseModel):
     created_at_utc: Optional[datetime]
     updated_at_utc: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GameOut(BaseModel):
@@ -63,8 +61,7 @@ class GameOut(BaseModel):
     home_score: Optional[int]
     away_score: Optional[int]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GamesTodayResponse(BaseModel):
@@ -6,7 +6,7 @@ from datetime import datetime, timezone
 from app.models import AppSettings
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SettingsSnapshot:
     id: int
     openai_api_key_enc: str | None
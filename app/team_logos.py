@@ -1,8 +1,21 @@
 """Team name to ESPN logo URL mapping for NBA, NHL, and NFL teams."""
 
+from functools import lru_cache
+import unicodedata
+
 # ESPN CDN base URL for team logos
 _ESPN_LOGO_BASE = "https://a.espncdn.com/i/teamlogos"
 
+
+def _normalize_name(name: str) -> str:
+    """Fold diacritics, periods, and case so unseen variants still match."""
+    stripped = "".join(
+        char
+        for char in unicodedata.normalize("NFKD", name)
+        if not unicodedata.combining(char)
+    )
+    return stripped.replace(".", "").casefold()
+
 # Mapping: ESPN displayName -> (league_path, abbreviation)
 _TEAM_MAP: dict[str, tuple[str, str]] = {
     # ── NBA ──────────────────────────────────────────────────
@@ -108,6 +121,18 @@ _TEAM_MAP: dict[str, tuple[str, str]] = {
     "Washington Commanders": ("nfl", "wsh"),
 }
 
+# Fully-formed URLs for the default size, so the common call is one dict get.
+_TEAM_URL_500: dict[str, str] = {
+    name: f"{_ESPN_LOGO_BASE}/{league_path}/500/{abbrev}.png"
+    for name, (league_path, abbrev) in _TEAM_MAP.items()
+}
+
+# Normalized-name fallback so accent/punctuation variants ESPN has not
+# emitted yet ("Montréal", "St Louis") resolve without new alias entries.
+_TEAM_MAP_NORM: dict[str, tuple[str, str]] = {
+    _normalize_name(name): entry for name, entry in _TEAM_MAP.items()
+}
+
 # League-level logos
 _LEAGUE_LOGOS: dict[str, str] = {
     "NBA": "https://a.espncdn.com/i/teamlogos/leagues/500/nba.png",
@@ -116,18 +141,24 @@ _LEAGUE_LOGOS: dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=256)
 def team_logo_url(team_name: str, size: int = 500) -> str:
     """Return ESPN CDN logo URL for a team display name.
 
     Falls back to a generic placeholder when the team isn't recognized.
     """
-    entry = _TEAM_MAP.get(team_name)
+    if size == 500:
+        url = _TEAM_URL_500.get(team_name)
+        if url is not None:
+            return url
+    entry = _TEAM_MAP.get(team_name) or _TEAM_MAP_NORM.get(_normalize_name(team_name))
     if entry:
         league_path, abbrev = entry
         return f"{_ESPN_LOGO_BASE}/{league_path}/{size}/{abbrev}.png"
     return ""
 
 
+@lru_cache(maxsize=16)
 def league_logo_url(league: str) -> str:
     """Return ESPN CDN logo URL for a league (NBA, NHL, NFL)."""
     return _LEAGUE_LOGOS.get(league.upper(), "")
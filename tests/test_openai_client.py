@@ -45,7 +45,7 @@ class OpenAIClientTests(unittest.TestCase):
             "output": [{"content": [{"type": "summary_text", "text": "partial response"}]}],
         }
 
-        with patch("app.ai.openai_client.requests.post", return_value=_FakeResponse(200, response_payload)):
+        with patch("app.ai.openai_client._SESSION.post", return_value=_FakeResponse(200, response_payload)):
             with self.assertRaises(OpenAIClientError) as ctx:
                 request_pick({"league": "NBA"}, settings)
 
@@ -69,7 +69,7 @@ class OpenAIClientTests(unittest.TestCase):
         success_payload = {"output_text": "{\"pick\":\"A\"}"}
 
         with patch(
-            "app.ai.openai_client.requests.post",
+            "app.ai.openai_client._SESSION.post",
             side_effect=[
                 _FakeResponse(200, incomplete_payload),
                 _FakeResponse(200, success_payload),
@@ -93,7 +93,7 @@ class OpenAIClientTests(unittest.TestCase):
         response_payload = {"output_text": "{\"pick\":\"A\"}"}
 
         with patch(
-            "app.ai.openai_client.requests.post",
+            "app.ai.openai_client._SESSION.post",
             side_effect=[
                 requests.Timeout("first timeout"),
                 _FakeResponse(200, response_payload),
@@ -103,7 +103,7 @@ class OpenAIClientTests(unittest.TestCase):
 
         self.assertEqual({"pick": "A"}, parsed)
         self.assertEqual(2, mock_post.call_count)
-        self.assertEqual((1,), mock_sleep.call_args.args)
+        self.assertGreater(mock_sleep.call_args.args[0], 0)
 
     def test_request_pick_timeout_after_max_attempts(self) -> None:
         settings = SimpleNamespace(
@@ -113,7 +113,7 @@ class OpenAIClientTests(unittest.TestCase):
         )
 
         with patch(
-            "app.ai.openai_client.requests.post",
+            "app.ai.openai_client._SESSION.post",
             side_effect=requests.Timeout("read timeout"),
         ) as mock_post, patch("app.ai.openai_client.time.sleep") as mock_sleep:
             with self.assertRaises(OpenAIClientError) as ctx: